@@ -2,18 +2,38 @@
 
 Functions for fetching data from the Monzo API.
 Uses yearly chunking with forward pagination to handle API limits.
+Chunks are independent, so the export fetches them concurrently.
 """
 
+import asyncio
 from datetime import UTC, datetime, timedelta
+from operator import attrgetter, itemgetter
+from typing import Any
 
 import httpx
+import orjson
 from rich.progress import BarColumn, Progress, TaskID, TextColumn, TimeElapsedColumn
 
-from monzo_api.src.models import Account, Balance, MonzoExport, Pot, Transaction
-from monzo_api.src.utils import console, monzo_client
+from monzo_api.src.models import (
+    _TRANSACTIONS,
+    Account,
+    Balance,
+    Merchant,
+    MonzoExport,
+    Pot,
+    Transaction,
+)
+from monzo_api.src.utils import async_monzo_client, console, monzo_client
 
 CHUNK_SIZE_DAYS = 364  # Monzo API limit is 365 days
 
+_BY_CREATED = attrgetter("created")
+_ID = itemgetter("id")
+
+# Statuses that end a chunk early, mapped to whether they mean SCA expired.
+# 403: SCA expired, stop fetching. 400: invalid range, skip the chunk.
+_CHUNK_STOP_STATUSES = {403: True, 400: False}
+
 
 class SCAExpiredError(Exception):
     """Raised when the 90-day transaction limit is hit due to expired SCA.
@@ -36,25 +56,43 @@ class SCAExpiredError(Exception):
         )
 
 
+def _decode(resp: httpx.Response) -> Any:
+    """Parse a JSON response body with orjson, which is much faster than `resp.json()`."""
+    return orjson.loads(resp.content)
+
+
 def fetch_accounts(client: httpx.Client) -> list[Account]:
     """Fetch all accounts."""
     resp = client.get("/accounts")
     resp.raise_for_status()
-    return [Account.model_validate(a) for a in resp.json()["accounts"]]
+    return [Account.model_validate(a) for a in _decode(resp)["accounts"]]
 
 
 def fetch_pots(client: httpx.Client, account_id: str) -> list[Pot]:
     """Fetch pots for an account."""
     resp = client.get("/pots", params={"current_account_id": account_id})
     resp.raise_for_status()
-    return [Pot.model_validate(p) for p in resp.json()["pots"]]
+    return [Pot.model_validate(p) for p in _decode(resp)["pots"]]
+
+
+async def fetch_pots_async(client: httpx.AsyncClient, account_id: str) -> list[Pot]:
+    """Async version of `fetch_pots`."""
+    resp = await client.get("/pots", params={"current_account_id": account_id})
+    resp.raise_for_status()
+    return [Pot.model_validate(p) for p in _decode(resp)["pots"]]
+
+
+async def fetch_pots_all(client: httpx.AsyncClient, account_ids: list[str]) -> list[Pot]:
+    """Fetch pots for several accounts concurrently, in account order."""
+    per_account = await asyncio.gather(*(fetch_pots_async(client, i) for i in account_ids))
+    return [pot for pots in per_account for pot in pots]
 
 
 def fetch_balance(client: httpx.Client, account_id: str) -> Balance:
     """Fetch current balance for an account."""
     resp = client.get("/balance", params={"account_id": account_id})
     resp.raise_for_status()
-    return Balance.model_validate(resp.json())
+    return Balance.model_validate(_decode(resp))
 
 
 def _to_timestamp(dt: datetime) -> str:
@@ -62,61 +100,137 @@ def _to_timestamp(dt: datetime) -> str:
     return dt.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
 
 
+def _chunk_ranges(account: Account, days: int | None) -> list[tuple[datetime, datetime]]:
+    """Split the requested history into (since, before) windows under the API limit."""
+    now = datetime.now(UTC)
+    account_created = account.created or now - timedelta(days=CHUNK_SIZE_DAYS)
+
+    # Calculate start date
+    if days is not None:
+        start = max(now - timedelta(days=days), account_created)
+    else:
+        start = account_created
+
+    ranges = []
+    chunk_start = start
+    while chunk_start < now:
+        chunk_end = min(chunk_start + timedelta(days=CHUNK_SIZE_DAYS), now + timedelta(days=1))
+        ranges.append((chunk_start, chunk_end))
+        chunk_start = chunk_end
+    return ranges
+
+
+def _page_params(account_id: str, cursor: str, before: str) -> dict:
+    """Query params for the first page of a chunk; later pages only update "since"."""
+    return {
+        "account_id": account_id,
+        "limit": 100,
+        "expand[]": "merchant",
+        "since": cursor,
+        "before": before,
+    }
+
+
+def _read_page(resp: httpx.Response, seen_ids: set[str]) -> list[dict]:
+    """Get the raw transactions on a page that have not been seen before.
+
+    Duplicates are dropped before validation, so overlapping pages cost nothing.
+    Returns an empty list when there is nothing new, i.e. pagination is done.
+    """
+    resp.raise_for_status()
+
+    raw = _decode(resp).get("transactions", [])
+    new = [t for t in raw if t["id"] not in seen_ids]
+    seen_ids.update(map(_ID, new))
+    return new
+
+
+def _next_cursor(new: list[dict]) -> str:
+    """Cursor for the next page, backed up by 1s to catch same-timestamp transactions."""
+    newest = datetime.fromisoformat(max(new, key=itemgetter("created"))["created"])
+    return _to_timestamp(newest - timedelta(seconds=1))
+
+
 def _fetch_chunk(
     client: httpx.Client,
     account_id: str,
     since: datetime,
     before: datetime,
     seen_ids: set[str],
-) -> tuple[list[Transaction], bool]:
-    """Fetch all transactions in a time chunk with pagination.
+) -> tuple[list[dict], bool]:
+    """Fetch all raw transactions in a time chunk with pagination.
 
     Returns:
         Tuple of (transactions, sca_expired). If sca_expired is True,
         the caller should stop fetching and return what we have.
     """
-    txs: list[Transaction] = []
-    cursor = _to_timestamp(since)
-    before_str = _to_timestamp(before)
+    txs: list[dict] = []
+    params = _page_params(account_id, _to_timestamp(since), _to_timestamp(before))
 
     while True:
-        resp = client.get(
-            "/transactions",
-            params={
-                "account_id": account_id,
-                "limit": 100,
-                "expand[]": "merchant",
-                "since": cursor,
-                "before": before_str,
-            },
-        )
-
-        if resp.status_code == 403:
-            return txs, True  # SCA expired
-        if resp.status_code == 400:
-            break  # Invalid range, skip chunk
-        resp.raise_for_status()
+        resp = client.get("/transactions", params=params)
 
-        raw = resp.json().get("transactions", [])
-        if not raw:
-            break
+        sca_expired = _CHUNK_STOP_STATUSES.get(resp.status_code)
+        if sca_expired is not None:
+            return txs, sca_expired
 
-        page = [Transaction.model_validate(t) for t in raw]
-        new = [t for t in page if t.id not in seen_ids]
+        new = _read_page(resp, seen_ids)
         if not new:
-            break  # All duplicates
-
-        for t in new:
-            seen_ids.add(t.id)
+            break  # Empty page or all duplicates
         txs.extend(new)
+        params["since"] = _next_cursor(new)
 
-        # Back up cursor by 1s to catch same-timestamp transactions
-        newest = max(new, key=lambda t: t.created)
-        cursor = _to_timestamp(newest.created - timedelta(seconds=1))
+    return txs, False
+
+
+async def _fetch_chunk_async(
+    client: httpx.AsyncClient,
+    account_id: str,
+    since: datetime,
+    before: datetime,
+    seen_ids: set[str],
+) -> tuple[list[dict], bool]:
+    """Async version of `_fetch_chunk`."""
+    txs: list[dict] = []
+    params = _page_params(account_id, _to_timestamp(since), _to_timestamp(before))
+
+    while True:
+        resp = await client.get("/transactions", params=params)
+
+        sca_expired = _CHUNK_STOP_STATUSES.get(resp.status_code)
+        if sca_expired is not None:
+            return txs, sca_expired
+
+        new = _read_page(resp, seen_ids)
+        if not new:
+            break  # Empty page or all duplicates
+        txs.extend(new)
+        params["since"] = _next_cursor(new)
 
     return txs, False
 
 
+def _collect_chunks(results: list[tuple[list[dict], bool]]) -> list[Transaction]:
+    """Validate chunk results into date-ordered models, stopping at the first SCA expiry.
+
+    Raises:
+        SCAExpiredError: If SCA expired before any transactions were fetched.
+    """
+    raw_txs: list[dict] = []
+    for txs, sca_expired in results:
+        raw_txs.extend(txs)
+        if sca_expired:
+            if not raw_txs:
+                raise SCAExpiredError
+            break
+
+    # Sort validated datetimes rather than raw strings: timestamps without
+    # fractional seconds would otherwise sort after same-second ones with them
+    all_txs = _TRANSACTIONS.validate_python(raw_txs)
+    all_txs.sort(key=_BY_CREATED)
+    return all_txs
+
+
 def fetch_transactions(
     client: httpx.Client,
     account: Account,
@@ -140,49 +254,92 @@ def fetch_transactions(
     Returns:
         List of transactions sorted by created date.
     """
-    now = datetime.now(UTC)
-    account_created = account.created or now - timedelta(days=CHUNK_SIZE_DAYS)
-
-    # Calculate start date
-    if days is not None:
-        start = max(now - timedelta(days=days), account_created)
-    else:
-        start = account_created
-
-    # Calculate total chunks for progress
-    total_days = (now - start).days
-    total_chunks = max(1, (total_days + CHUNK_SIZE_DAYS - 1) // CHUNK_SIZE_DAYS)
+    ranges = _chunk_ranges(account, days)
 
     if progress and task_id is not None:
-        progress.update(task_id, total=total_chunks)
+        progress.update(task_id, total=max(1, len(ranges)))
 
-    # Fetch in yearly chunks
-    all_txs: list[Transaction] = []
+    # Fetch in yearly chunks, stopping early if SCA expires
+    results = []
     seen_ids: set[str] = set()
-    chunk_start = start
-    chunks_done = 0
+    fetched = 0
 
-    while chunk_start < now:
-        chunk_end = min(chunk_start + timedelta(days=CHUNK_SIZE_DAYS), now + timedelta(days=1))
-
-        txs, sca_expired = _fetch_chunk(client, account.id, chunk_start, chunk_end, seen_ids)
-        all_txs.extend(txs)
-        chunks_done += 1
+    for since, before in ranges:
+        txs, sca_expired = _fetch_chunk(client, account.id, since, before, seen_ids)
+        results.append((txs, sca_expired))
+        fetched += len(txs)
 
         if progress and task_id is not None:
             progress.update(
-                task_id, completed=chunks_done, description=f"{account.type} ({len(all_txs)})"
+                task_id, completed=len(results), description=f"{account.type} ({fetched})"
             )
 
         if sca_expired:
-            if not all_txs:
-                raise SCAExpiredError
             break
 
-        chunk_start = chunk_end
+    return _collect_chunks(results)
 
-    all_txs.sort(key=lambda t: t.created)
-    return all_txs
+
+async def fetch_transactions_async(
+    client: httpx.AsyncClient,
+    account: Account,
+    days: int | None = None,
+    progress: Progress | None = None,
+    task_id: TaskID | None = None,
+) -> list[Transaction]:
+    """Fetch transactions with all yearly chunks requested concurrently.
+
+    Each chunk paginates within its own window, so wall time is bounded by the
+    slowest chunk rather than the sum of all of them. See `fetch_transactions`.
+
+    Returns:
+        List of transactions sorted by created date.
+    """
+    ranges = _chunk_ranges(account, days)
+
+    if progress and task_id is not None:
+        progress.update(task_id, total=max(1, len(ranges)))
+
+    seen_ids: set[str] = set()
+    fetched = 0
+
+    async def fetch(since: datetime, before: datetime) -> tuple[list[dict], bool]:
+        nonlocal fetched
+        result = await _fetch_chunk_async(client, account.id, since, before, seen_ids)
+        fetched += len(result[0])
+        if progress and task_id is not None:
+            progress.update(task_id, advance=1, description=f"{account.type} ({fetched})")
+        return result
+
+    results = await asyncio.gather(*(fetch(since, before) for since, before in ranges))
+    return _collect_chunks(results)
+
+
+async def _fetch_all_pots(accounts: list[Account]) -> list[Pot]:
+    """Fetch pots for all accounts concurrently."""
+    async with async_monzo_client() as client:
+        return await fetch_pots_all(client, [acc.id for acc in accounts])
+
+
+async def _fetch_all_transactions(
+    accounts: list[Account], days: int | None, progress: Progress
+) -> tuple[dict[str, list[Transaction]], dict[str, Merchant]]:
+    """Fetch transactions for each account, keyed by account ID.
+
+    Returns:
+        Tuple of (transactions, merchants), with expanded merchants indexed by ID
+        as each account's transactions arrive.
+    """
+    transactions: dict[str, list[Transaction]] = {}
+    merchants: dict[str, Merchant] = {}
+    async with async_monzo_client() as client:
+        for acc in accounts:
+            task = progress.add_task(acc.type, total=1)
+            txs = await fetch_transactions_async(client, acc, days, progress, task)
+            transactions[acc.id] = txs
+            merchants.update({m.id: m for tx in txs if isinstance(m := tx.merchant, Merchant)})
+            progress.update(task, description=f"[green]{acc.type}[/green] ({len(txs)})")
+    return transactions, merchants
 
 
 def export(days: int | None = None) -> MonzoExport:
@@ -203,13 +360,10 @@ def export(days: int | None = None) -> MonzoExport:
         console.print(f"Accounts: {len(accounts)} ({len(active)} active)")
 
         # Pots
-        pots: list[Pot] = []
-        for acc in active:
-            pots.extend(fetch_pots(client, acc.id))
+        pots = asyncio.run(_fetch_all_pots(active))
         console.print(f"Pots: {len(pots)}")
 
         # Transactions
-        transactions: dict[str, list[Transaction]] = {}
         console.print()
         with Progress(
             TextColumn("[bold]{task.description}[/bold]"),
@@ -218,11 +372,7 @@ def export(days: int | None = None) -> MonzoExport:
             TimeElapsedColumn(),
             console=console,
         ) as progress:
-            for acc in active:
-                task = progress.add_task(acc.type, total=1)
-                txs = fetch_transactions(client, acc, days, progress, task)
-                transactions[acc.id] = txs
-                progress.update(task, description=f"[green]{acc.type}[/green] ({len(txs)})")
+            transactions, merchants = asyncio.run(_fetch_all_transactions(active, days, progress))
 
         total = sum(len(t) for t in transactions.values())
         console.print(f"\n[bold]Total:[/bold] {total} transactions")
@@ -234,4 +384,5 @@ def export(days: int | None = None) -> MonzoExport:
         accounts=accounts,
         pots=pots,
         transactions=transactions,
+        merchants_index=merchants,
     )
@@ -1,10 +1,10 @@
 """Monzo API CLI."""
 
-import json
 import os
 import subprocess
 import sys
 
+import orjson
 import typer
 from rich.table import Table
 
@@ -168,7 +168,7 @@ def status() -> None:
 
     # Cache status
     if CACHE_FILE.exists():
-        cache = json.loads(CACHE_FILE.read_text())
+        cache = orjson.loads(CACHE_FILE.read_bytes())
         tx_count = sum(len(txs) for txs in cache.get("transactions", {}).values())
         console.print(f"\n  [green]Cache:[/green] {CACHE_FILE.name}")
         console.print(f"         Accounts: {len(cache.get('accounts', []))}")
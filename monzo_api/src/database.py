@@ -73,9 +73,11 @@ Expanded Merchant (via ?expand[]=merchant)
 }
 """
 
+import re
 from pathlib import Path
 
 import duckdb
+import pyarrow as pa
 from rich.progress import Progress
 from rich.table import Table
 
@@ -208,31 +210,180 @@ CREATE INDEX IF NOT EXISTS idx_pots_account ON pots(account_id);
 """
 
 
-class MonzoDatabase:
-    """Interface for Monzo DuckDB database. Also a context manager for connections."""
+MEMORY = ":memory:"
+
+# A FOREIGN KEY clause in SCHEMA, with its leading comma and any comment line
+_FOREIGN_KEY = re.compile(r",(\s*--[^\n]*)?\s*FOREIGN KEY \(\w+\) REFERENCES \w+\(\w+\)")
+
+# Columns written by each import, in the order the import builds its rows
+ACCOUNT_COLUMNS = ("id", "type", "description", "created", "closed", "currency")
+MERCHANT_COLUMNS = (
+    "id",
+    "group_id",
+    "name",
+    "category",
+    "emoji",
+    "logo_url",
+    "online",
+    "atm",
+    "address",
+    "city",
+    "region",
+    "country",
+    "postcode",
+    "latitude",
+    "longitude",
+)
+TRANSACTION_COLUMNS = (
+    "id",
+    "account_id",
+    "merchant_id",
+    "created",
+    "settled",
+    "amount",
+    "currency",
+    "local_amount",
+    "local_currency",
+    "description",
+    "category",
+    "notes",
+    "mcc",
+    "scheme",
+    "is_load",
+    "include_in_spending",
+    "decline_reason",
+)
+POT_COLUMNS = (
+    "id",
+    "account_id",
+    "name",
+    "style",
+    "balance",
+    "goal",
+    "currency",
+    "created",
+    "updated",
+    "deleted",
+)
+
+
+def _staging_schema(
+    conn: duckdb.DuckDBPyConnection, table: str, columns: tuple[str, ...]
+) -> pa.Schema:
+    """Arrow schema for staging rows into a table, taken from its column types.
+
+    Timestamps are staged as UTC-aware, so DuckDB converts the models' aware
+    datetimes exactly as it does bound parameters.
+    """
+    query = f"SELECT {', '.join(columns)} FROM {table} LIMIT 0"  # noqa: S608
+    utc = pa.timestamp("us", tz="UTC")
+    return pa.schema(
+        field.with_type(utc) if pa.types.is_timestamp(field.type) else field
+        for field in conn.sql(query).to_arrow_table().schema
+    )
+
+
+def _bulk_upsert(
+    conn: duckdb.DuckDBPyConnection, table: str, columns: tuple[str, ...], rows: list[tuple]
+) -> int:
+    """Upsert rows in one statement by staging them as an Arrow table.
+
+    Rows repeating a primary key (the first column) keep the last one, as per-row
+    upserts would. Returns the number of rows given.
+    """
+    if not rows:
+        return 0
+    unique = list({row[0]: row for row in rows}.values())
+    cols = ", ".join(columns)
+    try:
+        staged = pa.table(
+            dict(zip(columns, map(list, zip(*unique, strict=True)), strict=True)),
+            schema=_staging_schema(conn, table, columns),
+        )
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Values Arrow cannot convert (e.g. a settled string among datetimes) are
+        # bound row by row instead, so DuckDB casts them as it always has
+        placeholders = ", ".join("?" * len(columns))
+        conn.executemany(
+            f"INSERT OR REPLACE INTO {table} ({cols}) VALUES ({placeholders})",  # noqa: S608
+            unique,
+        )
+        return len(rows)
+    conn.register("_stage", staged)
+    try:
+        conn.execute(f"INSERT OR REPLACE INTO {table} ({cols}) SELECT {cols} FROM _stage")  # noqa: S608
+    finally:
+        conn.unregister("_stage")
+    return len(rows)
 
-    def __init__(self, db_path: str | Path = DB_FILE, read_only: bool = False) -> None:
-        """Initialize database with given path."""
+
+class MonzoDatabase:
+    """Interface for Monzo DuckDB database. Also a context manager for connections.
+
+    Pass `MEMORY` (":memory:") as the path for a throwaway in-memory database. Its
+    connection stays open for the life of the object, since closing it would
+    discard the data.
+    """
+
+    __slots__ = ("_conn", "config", "db_path", "read_only")
+
+    def __init__(
+        self,
+        db_path: str | Path = DB_FILE,
+        read_only: bool = False,
+        config: dict[str, str | bool | int] | None = None,
+    ) -> None:
+        """Initialize database with given path.
+
+        Args:
+            db_path: Database file, or `MEMORY` for an in-memory database.
+            read_only: Open connections read-only.
+            config: DuckDB settings applied to each connection, e.g.
+                {"preserve_insertion_order": False, "threads": 2}.
+        """
         self.db_path = Path(db_path)
         self.read_only = read_only
+        self.config = config or {}
         self._conn: duckdb.DuckDBPyConnection | None = None
 
+    @property
+    def in_memory(self) -> bool:
+        """Whether this is an in-memory database."""
+        return str(self.db_path) == MEMORY
+
     def __enter__(self) -> duckdb.DuckDBPyConnection:
         """Open database connection."""
-        self._conn = duckdb.connect(str(self.db_path), read_only=self.read_only)
+        if self._conn is None or not self.in_memory:
+            self._conn = duckdb.connect(
+                str(self.db_path), read_only=self.read_only, config=self.config
+            )
         return self._conn
 
     def __exit__(self, exc_type: type | None, exc_val: Exception | None, exc_tb: object) -> None:
-        """Close database connection."""
-        if self._conn:
+        """Close database connection (kept open for in-memory databases)."""
+        if self._conn and not self.in_memory:
             self._conn.close()
             self._conn = None
 
-    def setup(self) -> None:
-        """Create all tables, views, and indexes."""
+    def setup(self, enforce_fks: bool = True) -> list[str]:
+        """Create all tables, views, and indexes.
+
+        Args:
+            enforce_fks: Create tables with their foreign keys. DuckDB checks these on
+                every insert, so rows must arrive parent-first. Has no effect on
+                tables that already exist.
+
+        Returns:
+            Names of the tables and views now in the database, sorted.
+        """
         with self as conn:
-            conn.execute(SCHEMA)
+            conn.execute(SCHEMA if enforce_fks else _FOREIGN_KEY.sub("", SCHEMA))
+            rows = conn.execute(
+                "SELECT table_name FROM information_schema.tables "
+                "WHERE table_schema = 'main' ORDER BY table_name"
+            ).fetchall()
         console.print(f"[green]Database setup complete:[/green] {self.db_path}")
+        return [row[0] for row in rows]
 
     def reset(self) -> None:
         """Drop all tables and recreate."""
@@ -245,16 +396,30 @@ class MonzoDatabase:
             conn.execute(SCHEMA)
         console.print(f"[yellow]Database reset complete:[/yellow] {self.db_path}")
 
-    def stats(self) -> dict[str, int]:
-        """Get row counts for all tables and views."""
-        tables = ["accounts", "merchants", "transactions", "pots"]
+    def stats(self, conn: duckdb.DuckDBPyConnection | None = None) -> dict[str, int]:
+        """Get row counts for all tables and views.
+
+        Args:
+            conn: Already-open connection to count with. Defaults to this instance's
+                open connection, if any, else a read-only one opened for this call.
+        """
+        conn = conn or self._conn
+        if conn is None:
+            # A new in-memory connection would be a different, empty database
+            db = (
+                self
+                if self.in_memory
+                else MonzoDatabase(self.db_path, read_only=True, config=self.config)
+            )
+            with db as ro_conn:
+                return self.stats(ro_conn)
 
-        with MonzoDatabase(self.db_path, read_only=True) as conn:
-            result = {}
-            for table in [*tables, "daily_balances"]:
-                row = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()  # noqa: S608
-                result[table] = row[0] if row else 0
-            return result
+        tables = ["accounts", "merchants", "transactions", "pots"]
+        result = {}
+        for table in [*tables, "daily_balances"]:
+            row = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()  # noqa: S608
+            result[table] = row[0] if row else 0
+        return result
 
     def print_stats(self) -> None:
         """Print database statistics."""
@@ -272,121 +437,86 @@ class MonzoDatabase:
 
     def import_accounts(self, accounts: list[Account]) -> int:
         """Import accounts into database. Returns count imported."""
+        rows = [
+            (acc.id, acc.type, acc.description, acc.created, acc.closed, acc.currency)
+            for acc in accounts
+        ]
         with self as conn:
-            for acc in accounts:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO accounts
-                    (id, type, description, created, closed, currency)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        acc.id,
-                        acc.type,
-                        acc.description,
-                        acc.created,
-                        acc.closed,
-                        acc.currency,
-                    ),
-                )
-        return len(accounts)
+            return _bulk_upsert(conn, "accounts", ACCOUNT_COLUMNS, rows)
 
     def import_merchants(self, merchants: dict[str, Merchant]) -> int:
         """Import merchants into database. Returns count imported."""
-        with self as conn:
-            for m in merchants.values():
-                addr = m.address
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO merchants
-                    (id, group_id, name, category, emoji, logo_url, online, atm,
-                     address, city, region, country, postcode, latitude, longitude)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        m.id,
-                        m.group_id,
-                        m.name,
-                        m.category,
-                        m.emoji,
-                        m.logo,
-                        m.online,
-                        m.atm,
-                        addr.formatted if addr else None,
-                        addr.city if addr else None,
-                        addr.region if addr else None,
-                        addr.country if addr else None,
-                        addr.postcode if addr else None,
-                        addr.latitude if addr else None,
-                        addr.longitude if addr else None,
-                    ),
+        rows = []
+        for m in merchants.values():
+            addr = m.address
+            rows.append(
+                (
+                    m.id,
+                    m.group_id,
+                    m.name,
+                    m.category,
+                    m.emoji,
+                    m.logo,
+                    m.online,
+                    m.atm,
+                    addr.formatted if addr else None,
+                    addr.city if addr else None,
+                    addr.region if addr else None,
+                    addr.country if addr else None,
+                    addr.postcode if addr else None,
+                    addr.latitude if addr else None,
+                    addr.longitude if addr else None,
                 )
-        return len(merchants)
+            )
+        with self as conn:
+            return _bulk_upsert(conn, "merchants", MERCHANT_COLUMNS, rows)
 
     def import_transactions(self, transactions: list[Transaction]) -> int:
         """Import transactions into database. Returns count imported."""
+        rows = [
+            (
+                tx.id,
+                tx.account_id,
+                tx.merchant_id,
+                tx.created,
+                tx.settled or None,  # Can be empty string
+                tx.amount,
+                tx.currency,
+                tx.local_amount,
+                tx.local_currency,
+                tx.description,
+                tx.category,
+                tx.notes,
+                tx.metadata.get("mcc") if tx.metadata else None,
+                tx.scheme,
+                tx.is_load,
+                tx.include_in_spending,
+                tx.decline_reason,
+            )
+            for tx in transactions
+        ]
         with self as conn:
-            for tx in transactions:
-                # Handle settled being empty string
-                settled = tx.settled if tx.settled and tx.settled != "" else None
-
-                # Extract MCC from metadata
-                mcc = tx.metadata.get("mcc") if tx.metadata else None
-
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO transactions
-                    (id, account_id, merchant_id, created, settled, amount, currency,
-                     local_amount, local_currency, description, category, notes,
-                     mcc, scheme, is_load, include_in_spending, decline_reason)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        tx.id,
-                        tx.account_id,
-                        tx.merchant_id,
-                        tx.created,
-                        settled,
-                        tx.amount,
-                        tx.currency,
-                        tx.local_amount,
-                        tx.local_currency,
-                        tx.description,
-                        tx.category,
-                        tx.notes,
-                        mcc,
-                        tx.scheme,
-                        tx.is_load,
-                        tx.include_in_spending,
-                        tx.decline_reason,
-                    ),
-                )
-        return len(transactions)
+            return _bulk_upsert(conn, "transactions", TRANSACTION_COLUMNS, rows)
 
     def import_pots(self, pots: list[Pot]) -> int:
         """Import pots into database. Returns count imported."""
+        rows = [
+            (
+                pot.id,
+                pot.current_account_id,
+                pot.name,
+                pot.style,
+                pot.balance,
+                pot.goal_amount,
+                pot.currency,
+                pot.created,
+                pot.updated,
+                pot.deleted,
+            )
+            for pot in pots
+        ]
         with self as conn:
-            for pot in pots:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO pots
-                    (id, account_id, name, style, balance, goal, currency, created, updated, deleted)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        pot.id,
-                        pot.current_account_id,
-                        pot.name,
-                        pot.style,
-                        pot.balance,
-                        pot.goal_amount,
-                        pot.currency,
-                        pot.created,
-                        pot.updated,
-                        pot.deleted,
-                    ),
-                )
-        return len(pots)
+            return _bulk_upsert(conn, "pots", POT_COLUMNS, rows)
 
     def import_data(self, data: MonzoExport) -> dict[str, int]:
         """Import all data from a MonzoExport. Returns counts per table."""
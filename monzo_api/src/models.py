@@ -1,9 +1,17 @@
 """Pydantic models for Monzo API data."""
 
+import sys
+import warnings
+from collections.abc import Mapping
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
+from typing import Any, BinaryIO, Self
 
-from pydantic import BaseModel, Field
+import ijson
+import orjson
+import pyarrow as pa
+from pydantic import AliasChoices, AliasPath, BaseModel, Field, TypeAdapter
 
 
 class Address(BaseModel):
@@ -21,6 +29,8 @@ class Address(BaseModel):
     zoom_level: int | None = None
     approximate: bool | None = None
 
+    model_config = {"frozen": True}
+
 
 class Merchant(BaseModel):
     """Merchant details (expanded from transaction)."""
@@ -36,7 +46,7 @@ class Merchant(BaseModel):
     address: Address | None = None
     disable_feedback: bool | None = None
 
-    model_config = {"extra": "ignore"}
+    model_config = {"extra": "ignore", "frozen": True}
 
 
 class Counterparty(BaseModel):
@@ -47,7 +57,7 @@ class Counterparty(BaseModel):
     sort_code: str | None = None
     user_id: str | None = None
 
-    model_config = {"extra": "ignore"}
+    model_config = {"extra": "ignore", "frozen": True}
 
 
 class Transaction(BaseModel):
@@ -58,13 +68,19 @@ class Transaction(BaseModel):
     amount: int  # In minor units (pence), negative = spend
     currency: str = "GBP"
     created: datetime
-    settled: datetime | str | None = None  # Can be empty string
+    settled: datetime | str | None = Field(None, union_mode="left_to_right")  # Can be ""
     description: str | None = None
     category: str | None = None
     notes: str | None = None
 
-    # Merchant - can be string ID or expanded object
+    # Merchant - bare ID string unless expanded. When merchant_id is not given (API
+    # data, older exports), it is read from a raw expanded merchant in pydantic-core,
+    # or else derived from the validated merchant, so it must be declared after it
     merchant: Merchant | str | None = None
+    merchant_id: str | None = Field(
+        default_factory=lambda data: _merchant_id(data.get("merchant")),
+        validation_alias=AliasChoices("merchant_id", AliasPath("merchant", "id")),
+    )
 
     # Foreign currency
     local_amount: int | None = None
@@ -82,20 +98,28 @@ class Transaction(BaseModel):
     # Raw metadata dict (MCC, trip_id, etc)
     metadata: dict | None = None
 
-    model_config = {"extra": "ignore"}
-
-    @property
-    def merchant_id(self) -> str | None:
-        """Get merchant ID whether expanded or not."""
-        if isinstance(self.merchant, Merchant):
-            return self.merchant.id
-        return self.merchant if self.merchant else None
+    model_config = {"extra": "ignore", "frozen": True}
 
     @property
     def amount_pounds(self) -> float:
-        """Get amount in pounds (e.g. -5.03 instead of -503)."""
+        """Get amount in pounds (e.g. -5.03 instead of -503).
+
+        Deprecated: sum `amount` (pence) and format with `formatted_amount` instead.
+        """
+        warnings.warn(
+            "amount_pounds is deprecated; use amount (pence) or formatted_amount",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         return self.amount / 100
 
+    @property
+    def formatted_amount(self) -> str:
+        """Format amount in pounds using integer maths only (e.g. '-5.03')."""
+        sign = "-" if self.amount < 0 else ""
+        pounds, pence = divmod(abs(self.amount), 100)
+        return f"{sign}{pounds}.{pence:02d}"
+
 
 class Account(BaseModel):
     """A Monzo account."""
@@ -107,7 +131,7 @@ class Account(BaseModel):
     closed: bool = False
     currency: str = "GBP"
 
-    model_config = {"extra": "ignore"}
+    model_config = {"extra": "ignore", "frozen": True}
 
 
 class Balance(BaseModel):
@@ -151,7 +175,7 @@ class Pot(BaseModel):
     locked: bool = False
     current_account_id: str | None = Field(None, alias="current_account_id")
 
-    model_config = {"extra": "ignore"}
+    model_config = {"extra": "ignore", "frozen": True}
 
     @property
     def balance_pounds(self) -> float:
@@ -159,6 +183,11 @@ class Pot(BaseModel):
         return self.balance / 100
 
 
+# Compiled once, validates one account's transactions per call - shared by the
+# fetch path in api_calls and load_streaming
+_TRANSACTIONS = TypeAdapter(list[Transaction])
+
+
 class MonzoExport(BaseModel):
     """Complete export of Monzo data."""
 
@@ -167,27 +196,126 @@ class MonzoExport(BaseModel):
     days: int | None = None  # None = full history
     accounts: list[Account]
     pots: list[Pot]
+    merchants_index: dict[str, Merchant] = Field(default_factory=dict)  # Filled at fetch time
+    # Declared last so `save` writes it after the small fields (see `load_streaming`)
     transactions: dict[str, list[Transaction]]  # Keyed by account_id
 
-    @property
+    # Frozen so the cached views below cannot go stale through field assignment
+    model_config = {"frozen": True}
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the export, dropping cached views if any field is updated.
+
+        pydantic copies the instance `__dict__`, which is also where the cached
+        properties store their values.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name, attr in vars(MonzoExport).items():
+                if isinstance(attr, cached_property):
+                    copied.__dict__.pop(name, None)
+        return copied
+
+    @cached_property
     def all_transactions(self) -> list[Transaction]:
-        """Get all transactions across all accounts."""
+        """Get all transactions across all accounts (computed once)."""
         return [tx for txs in self.transactions.values() for tx in txs]
 
-    @property
+    @cached_property
     def all_merchants(self) -> dict[str, Merchant]:
-        """Extract unique merchants from all transactions."""
-        merchants = {}
-        for tx in self.all_transactions:
-            if isinstance(tx.merchant, Merchant):
-                merchants[tx.merchant.id] = tx.merchant
-        return merchants
+        """Unique expanded merchants, keyed by ID.
+
+        Uses the index built at fetch time. Exports saved without one fall back to
+        a single walk over all transactions.
+        """
+        if self.merchants_index:
+            return self.merchants_index
+        return {m.id: m for tx in self.all_transactions if isinstance(m := tx.merchant, Merchant)}
+
+    @cached_property
+    def transactions_table(self) -> pa.Table:
+        """Columnar (Arrow) view of all transactions, for vectorised analytics.
+
+        Built once. Amounts stay in integer pence.
+        """
+        txs = self.all_transactions
+        return pa.table(
+            {
+                "id": pa.array([tx.id for tx in txs], type=pa.string()),
+                "account_id": pa.array([tx.account_id for tx in txs], type=pa.string()),
+                "merchant_id": pa.array([tx.merchant_id for tx in txs], type=pa.string()),
+                "created": pa.array([tx.created for tx in txs], type=pa.timestamp("ms", tz="UTC")),
+                "amount": pa.array([tx.amount for tx in txs], type=pa.int64()),
+                "category": pa.array([tx.category for tx in txs], type=pa.string()),
+            }
+        )
 
     def save(self, path: str | Path) -> None:
-        """Save to JSON file."""
-        Path(path).write_text(self.model_dump_json(indent=2))
+        """Save to JSON file.
+
+        orjson serialises the model tree directly (see `_json_default`), skipping
+        the intermediate dict that `model_dump` would build.
+        """
+        # Only declared fields: cached properties also live in this model's __dict__
+        fields = {name: getattr(self, name) for name in type(self).model_fields}
+        Path(path).write_bytes(
+            orjson.dumps(
+                fields,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC,
+            )
+        )
 
     @classmethod
     def load(cls, path: str | Path) -> "MonzoExport":
         """Load from JSON file."""
-        return cls.model_validate_json(Path(path).read_text())
+        # pydantic-core parses the bytes straight into models, with no str decode
+        # or intermediate dicts
+        return cls.model_validate_json(Path(path).read_bytes())
+
+    @classmethod
+    def load_streaming(cls, path: str | Path) -> "MonzoExport":
+        """Load a JSON file written by `save` one account's transactions at a time.
+
+        The file is parsed incrementally, so the whole raw JSON document is never held
+        in memory alongside the models.
+        """
+        with Path(path).open("rb") as f:
+            head = _read_head(f)
+            f.seek(0)
+            transactions = {
+                acc_id: _TRANSACTIONS.validate_python(txs)
+                for acc_id, txs in ijson.kvitems(f, "transactions", use_float=True)
+            }
+        return cls.model_validate({**head, "transactions": transactions})
+
+
+# ==========================================
+# SERIALISATION / STREAMING
+# ==========================================
+
+
+def _json_default(obj: object) -> object:
+    """Serialise nested models for orjson, which handles datetimes natively."""
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _merchant_id(merchant: Merchant | str | None) -> str | None:
+    """Interned ID of a string-or-object merchant, which repeats across many transactions."""
+    merchant_id = merchant.id if isinstance(merchant, Merchant) else merchant
+    return sys.intern(merchant_id) if merchant_id else None
+
+
+def _read_head(f: BinaryIO) -> dict:
+    """Parse the top-level fields ahead of "transactions", stopping when it is reached.
+
+    Fields that older files wrote after transactions are left out.
+    """
+    builder = ijson.ObjectBuilder()
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if not prefix and event == "map_key" and value == "transactions":
+            break
+        builder.event(event, value)
+    return builder.value
@@ -1,9 +1,11 @@
 """Shared utilities for Monzo API scripts."""
 
+import atexit
 import json
 import os
-from collections.abc import Generator
-from contextlib import contextmanager
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
+from functools import cache, lru_cache
 
 import httpx
 from rich.console import Console
@@ -13,24 +15,40 @@ from monzo_api.src.config import API_URL, ENV_SECRETS_FILE, TOKEN_FILE
 # Shared console for all output
 console = Console()
 
+# Connection pools reused across monzo_client() calls, keyed by access token
+_CLIENTS: dict[str, httpx.Client] = {}
 
+
+@cache
 def load_env_secrets() -> None:
-    """Load variables from .env.secrets file into environment."""
+    """Load variables from .env.secrets file into environment (once per process)."""
     if ENV_SECRETS_FILE.exists():
-        for raw_line in ENV_SECRETS_FILE.read_text().splitlines():
-            line = raw_line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                key, _, value = line.partition("=")
-                # Remove comments and whitespace/quotes
-                value = value.split("#")[0].strip().strip("'").strip('"')
-                os.environ.setdefault(key.strip(), value)
+        lines = map(str.strip, ENV_SECRETS_FILE.read_text().splitlines())
+        pairs = (line.partition("=") for line in lines if line and line[0] != "#" and "=" in line)
+        # Remove comments and whitespace/quotes, without overriding the real environment
+        items = [
+            (key.strip(), value.split("#")[0].strip().strip("'").strip('"'))
+            for key, _, value in pairs
+        ]
+        # Reversed, so the first occurrence of a repeated key wins
+        secrets = dict(reversed(items))
+        os.environ.update({key: value for key, value in secrets.items() if key not in os.environ})
+
+
+@lru_cache(maxsize=4)
+def _read_token_file(mtime_ns: int) -> dict:
+    """Parse the token file. Keyed on mtime so a rewritten token is re-read."""
+    return json.loads(TOKEN_FILE.read_bytes())
 
 
 def load_token_data() -> dict | None:
     """Load full token data from file if exists."""
-    if TOKEN_FILE.exists():
-        return json.loads(TOKEN_FILE.read_text())
-    return None
+    try:
+        mtime_ns = TOKEN_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    # A copy, so callers that edit the dict cannot corrupt the cached one
+    return dict(_read_token_file(mtime_ns))
 
 
 def load_token() -> str:
@@ -51,21 +69,64 @@ def save_token(token_data: dict) -> None:
     TOKEN_FILE.write_text(json.dumps(token_data, indent=2))
 
 
+def _close_clients() -> None:
+    """Close all shared HTTP clients."""
+    for client in _CLIENTS.values():
+        client.close()
+    _CLIENTS.clear()
+
+
+atexit.register(_close_clients)
+
+
 @contextmanager
 def monzo_client(token: str | None = None) -> Generator[httpx.Client, None, None]:
-    """Create authenticated HTTP client.
+    """Get authenticated HTTP client.
+
+    The client is shared between calls with the same token, so the HTTP/2 connection
+    and TLS session are reused rather than torn down each time. Clients are closed at
+    interpreter exit.
 
     Args:
         token: Access token. If None, loads from file.
     """
     if token is None:
         token = load_token()
-    client = httpx.Client(
+    client = _CLIENTS.get(token)
+    if client is None or client.is_closed:
+        client = httpx.Client(
+            base_url=API_URL,
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=8, max_connections=16, keepalive_expiry=60
+            ),
+        )
+        _CLIENTS[token] = client
+    yield client
+
+
+@asynccontextmanager
+async def async_monzo_client(
+    token: str | None = None,
+) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Create authenticated async HTTP client for concurrent requests.
+
+    Not shared like `monzo_client`, as an async client is bound to its event loop.
+    Concurrent requests are multiplexed as HTTP/2 streams over a single connection,
+    so they share one TLS handshake.
+
+    Args:
+        token: Access token. If None, loads from file.
+    """
+    if token is None:
+        token = load_token()
+    async with httpx.AsyncClient(
         base_url=API_URL,
         headers={"Authorization": f"Bearer {token}"},
         timeout=30.0,
-    )
-    try:
+        http2=True,
+        limits=httpx.Limits(max_connections=1, max_keepalive_connections=1),
+    ) as client:
         yield client
-    finally:
-        client.close()
@@ -1,48 +1,67 @@
 """Pytest fixtures for Monzo API tests."""
 
-import json
+import hashlib
+import os
+import tempfile
+import time
+from collections.abc import Generator
 from pathlib import Path
 
 import httpx
 import pytest
 
-PROJECT_ROOT = Path(__file__).parent.parent
-TOKEN_FILE = PROJECT_ROOT / ".monzo_token.json"
-API_URL = "https://api.monzo.com"
+from monzo_api.src.config import TOKEN_FILE
+from monzo_api.src.utils import load_token_data
+from monzo_api.src.utils import monzo_client as create_client
+
+ACCOUNT_ID_CACHE_SECONDS = 3600
 
 
 @pytest.fixture(scope="session")
 def access_token() -> str | None:
     """Load access token from file if available."""
-    if not TOKEN_FILE.exists():
-        return None
-    data = json.loads(TOKEN_FILE.read_text())
-    return data.get("access_token")
+    data = load_token_data()
+    return data.get("access_token") if data else None
 
 
 @pytest.fixture(scope="session")
-def monzo_client(access_token: str | None) -> httpx.Client | None:
+def monzo_client(access_token: str | None) -> Generator[httpx.Client | None, None, None]:
     """Create authenticated httpx client."""
     if not access_token:
-        return None
-    return httpx.Client(
-        base_url=API_URL,
-        headers={"Authorization": f"Bearer {access_token}"},
-        timeout=30.0,
-    )
+        yield None
+        return
+    with create_client(access_token) as client:
+        yield client
 
 
 @pytest.fixture(scope="session")
-def account_id(monzo_client: httpx.Client | None) -> str | None:
-    """Get the first active uk_retail account ID."""
-    if not monzo_client:
+def account_id(access_token: str | None, monzo_client: httpx.Client | None) -> str | None:
+    """Get the first active uk_retail account ID.
+
+    Memoised on disk per token for an hour, so parallel workers (pytest -n) and
+    repeat runs share one /accounts call.
+    """
+    if not access_token or not monzo_client:
         return None
+    token_hash = hashlib.sha256(access_token.encode()).hexdigest()[:16]
+    cache_file = Path(tempfile.gettempdir()) / f"monzo_acct_{token_hash}.txt"
+    try:
+        fresh = time.time() - cache_file.stat().st_mtime < ACCOUNT_ID_CACHE_SECONDS
+        if fresh and (cached := cache_file.read_text()):
+            return cached
+    except FileNotFoundError:
+        pass
+
     resp = monzo_client.get("/accounts", params={"account_type": "uk_retail"})
     if resp.status_code != 200:
         return None
     accounts = resp.json().get("accounts", [])
     for acc in accounts:
         if not acc.get("closed", False):
+            # Write then rename, so other workers never read a partly written file
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_text(acc["id"])
+            tmp_file.replace(cache_file)
             return acc["id"]
     return None
 
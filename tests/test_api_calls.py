@@ -1,12 +1,21 @@
-"""Tests for api_calls.py fetch_transactions."""
+"""Tests for api_calls.py fetch functions."""
 
+import asyncio
 from datetime import UTC, datetime, timedelta
+from itertools import accumulate, pairwise
+from types import SimpleNamespace
 
 import httpx
+import orjson
 import pytest
 from pytest_mock import MockerFixture
 
-from monzo_api.src.api_calls import SCAExpiredError, fetch_transactions
+from monzo_api.src.api_calls import (
+    SCAExpiredError,
+    fetch_pots_all,
+    fetch_transactions,
+    fetch_transactions_async,
+)
 from monzo_api.src.models import Account
 
 
@@ -22,26 +31,55 @@ def make_tx(tx_id: str, created: datetime, amount: int = -100) -> dict:
     }
 
 
+# Attribute names computed once; a class spec is re-introspected for every mock
+_CLIENT_SPEC = dir(httpx.Client)
+_ASYNC_CLIENT_SPEC = dir(httpx.AsyncClient)
+
+
 @pytest.fixture
 def mock_client(mocker: MockerFixture):
     """Create a mock httpx.Client."""
-    return mocker.MagicMock(spec=httpx.Client)
+    return mocker.MagicMock(spec_set=_CLIENT_SPEC)
 
 
 @pytest.fixture
-def make_response(mocker: MockerFixture):
-    """Factory fixture to create mock response objects."""
-
-    def _make_response(txs: list[dict], status: int = 200):
-        resp = mocker.MagicMock()
-        resp.status_code = status
-        resp.json.return_value = {"transactions": txs}
-        if status >= 400:
-            resp.raise_for_status.side_effect = httpx.HTTPStatusError(
-                "Error", request=mocker.MagicMock(), response=resp
-            )
-        return resp
+def mock_async_client(mocker: MockerFixture):
+    """Create a mock httpx.AsyncClient."""
+    client = mocker.MagicMock(spec_set=_ASYNC_CLIENT_SPEC)
+    client.get = mocker.AsyncMock()
+    return client
+
+
+def _ok() -> None:
+    pass
+
+
+def _raise_http_error() -> None:
+    raise httpx.HTTPStatusError("Error", request=None, response=None)
+
+
+def _make_response(txs: list[dict], status: int = 200) -> SimpleNamespace:
+    """Create a lightweight stand-in for httpx.Response (much cheaper than a MagicMock)."""
+    return SimpleNamespace(
+        status_code=status,
+        content=orjson.dumps({"transactions": txs}),
+        raise_for_status=_raise_http_error if status >= 400 else _ok,
+    )
+
+
+def _unexpected_parse() -> None:
+    raise AssertionError("should not parse or check a 403 response")
+
 
+# Stubs are immutable, so the common pages are built once and shared
+_EMPTY_PAGE = _make_response([])
+# 403 must be handled from the status code alone; it has no body to parse
+_SCA_EXPIRED = SimpleNamespace(status_code=403, raise_for_status=_unexpected_parse)
+
+
+@pytest.fixture(scope="module")
+def make_response():
+    """Factory fixture to create stub response objects."""
     return _make_response
 
 
@@ -59,18 +97,32 @@ def test_account() -> Account:
 class TestFetchTransactions:
     """Tests for fetch_transactions (yearly chunking)."""
 
-    def test_full_history_uses_account_created(self, mock_client, make_response, test_account):
-        """Test that days=None fetches from account creation."""
+    @pytest.mark.parametrize("page_sizes", [[5], [100, 50]], ids=["single_page", "paginated"])
+    def test_fetches_pages_from_account_created(
+        self, mock_client, make_response, test_account, page_sizes
+    ):
+        """Test days=None fetches from account creation, across one or more pages."""
         now = datetime.now(UTC)
-        txs_data = [make_tx(f"tx_{i}", now - timedelta(days=i)) for i in range(5)]
-
-        mock_client.get.side_effect = [
-            make_response(txs_data),
-            make_response([]),
+        bounds = [0, *accumulate(page_sizes)]
+        pages = [
+            [make_tx(f"tx_{i}", now - timedelta(days=i)) for i in range(lo, hi)]
+            for lo, hi in pairwise(bounds)
         ]
+        responses = iter([*map(make_response, pages), _EMPTY_PAGE])
+        sent_since = []
+
+        def get(path, params):
+            # Snapshot: the fetcher reuses one params dict across pages
+            sent_since.append(params["since"])
+            return next(responses)
+
+        mock_client.get.side_effect = get
 
         txs = fetch_transactions(mock_client, test_account, days=None)
-        assert len(txs) == 5
+
+        assert len(txs) == sum(page_sizes)
+        assert len(sent_since) == len(page_sizes) + 1
+        assert sent_since[0] == test_account.created.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
 
     def test_days_limits_history(self, mock_client, make_response):
         """Test that days param limits how far back we fetch."""
@@ -85,7 +137,7 @@ class TestFetchTransactions:
 
         mock_client.get.side_effect = [
             make_response(txs_data),
-            make_response([]),
+            _EMPTY_PAGE,
         ]
 
         txs = fetch_transactions(mock_client, account, days=30)
@@ -104,7 +156,7 @@ class TestFetchTransactions:
 
         mock_client.get.side_effect = [
             make_response(txs_data),
-            make_response([]),
+            _EMPTY_PAGE,
         ]
 
         txs = fetch_transactions(mock_client, account, days=100)
@@ -113,7 +165,8 @@ class TestFetchTransactions:
 
     def test_sca_expired_on_first_request_raises(self, mock_client, make_response, test_account):
         """Test that SCAExpiredError is raised when 403 on first tx request."""
-        mock_client.get.return_value = make_response([], status=403)
+        # A single response: any retry would raise StopIteration
+        mock_client.get.side_effect = [_SCA_EXPIRED]
 
         with pytest.raises(SCAExpiredError):
             fetch_transactions(mock_client, test_account)
@@ -127,7 +180,7 @@ class TestFetchTransactions:
 
         mock_client.get.side_effect = [
             make_response(page1),
-            make_response([], status=403),
+            _SCA_EXPIRED,
         ]
 
         txs = fetch_transactions(mock_client, test_account)
@@ -144,7 +197,7 @@ class TestFetchTransactions:
 
         mock_client.get.side_effect = [
             make_response(txs_data),
-            make_response([]),
+            _EMPTY_PAGE,
         ]
 
         txs = fetch_transactions(mock_client, test_account)
@@ -152,22 +205,6 @@ class TestFetchTransactions:
         assert txs[0].id == "tx_old"
         assert txs[1].id == "tx_new"
 
-    def test_pagination_within_chunk(self, mock_client, make_response, test_account):
-        """Test pagination when >100 transactions in a chunk."""
-        now = datetime.now(UTC)
-
-        page1 = [make_tx(f"tx_{i}", now - timedelta(days=i)) for i in range(100)]
-        page2 = [make_tx(f"tx_{i}", now - timedelta(days=i)) for i in range(100, 150)]
-
-        mock_client.get.side_effect = [
-            make_response(page1),
-            make_response(page2),
-            make_response([]),
-        ]
-
-        txs = fetch_transactions(mock_client, test_account)
-        assert len(txs) == 150
-
     def test_multi_year_account(self, mock_client, make_response):
         """Test account spanning multiple years."""
         now = datetime.now(UTC)
@@ -184,11 +221,11 @@ class TestFetchTransactions:
 
         mock_client.get.side_effect = [
             make_response(year1_txs),
-            make_response([]),
+            _EMPTY_PAGE,
             make_response(year2_txs),
-            make_response([]),
+            _EMPTY_PAGE,
             make_response(year3_txs),
-            make_response([]),
+            _EMPTY_PAGE,
         ]
 
         txs = fetch_transactions(mock_client, account)
@@ -208,10 +245,76 @@ class TestFetchTransactions:
 
         mock_client.get.side_effect = [
             make_response(year1_txs),
-            make_response([]),
+            _EMPTY_PAGE,
             make_response([], status=400),
-            make_response([]),
+            _EMPTY_PAGE,
         ]
 
         txs = fetch_transactions(mock_client, account)
         assert len(txs) == 20
+
+
+class TestFetchTransactionsAsync:
+    """Tests for fetch_transactions_async (concurrent yearly chunks)."""
+
+    def test_multi_year_account(self, mock_async_client):
+        """Test chunks combine in date order, even when later chunks finish first."""
+        now = datetime.now(UTC)
+        account = Account(id="acc_test", type="uk_retail", created=now - timedelta(days=800))
+        days_ago = [*range(700, 730), *range(350, 390), *range(20)]
+        server_txs = [make_tx(f"tx_{d}", now - timedelta(days=d)) for d in days_ago]
+        # Returned by every chunk, so the chunks must share their seen IDs
+        shared = make_tx("tx_shared", now - timedelta(days=400))
+        requested_before = []
+
+        async def get(path, params):
+            since = datetime.fromisoformat(params["since"])
+            before = datetime.fromisoformat(params["before"])
+            # Older chunks answer slower, so the newest chunk finishes first
+            await asyncio.sleep((now - since).days / 20000)
+            requested_before.append(before)
+            in_range = [
+                tx for tx in server_txs if since <= datetime.fromisoformat(tx["created"]) < before
+            ]
+            return _make_response([shared, *in_range][: params["limit"]])
+
+        mock_async_client.get.side_effect = get
+
+        txs = asyncio.run(fetch_transactions_async(mock_async_client, account))
+
+        assert requested_before[-1] == min(requested_before)
+        expected = sorted([*server_txs, shared], key=lambda tx: tx["created"])
+        assert [tx.id for tx in txs] == [tx["id"] for tx in expected]
+
+    def test_sca_expired_on_first_request_raises(
+        self, mock_async_client, make_response, test_account
+    ):
+        """Test that SCAExpiredError is raised when 403 on first tx request."""
+        mock_async_client.get.side_effect = [_SCA_EXPIRED]
+
+        with pytest.raises(SCAExpiredError):
+            asyncio.run(fetch_transactions_async(mock_async_client, test_account))
+
+
+class TestFetchPotsAll:
+    """Tests for fetch_pots_all (concurrent per-account pots)."""
+
+    def test_flattens_in_account_order(self, mock_async_client):
+        """Test pots from every account are returned, grouped in account order."""
+        pots_by_account = {
+            "acc_1": [{"id": "pot_1", "name": "Bills", "balance": 100}],
+            "acc_2": [
+                {"id": "pot_2", "name": "Savings", "balance": 200},
+                {"id": "pot_3", "name": "Holiday", "balance": 300},
+            ],
+        }
+
+        async def get(path, params):
+            await asyncio.sleep(0.01 if params["current_account_id"] == "acc_1" else 0)
+            pots = pots_by_account[params["current_account_id"]]
+            return SimpleNamespace(content=orjson.dumps({"pots": pots}), raise_for_status=_ok)
+
+        mock_async_client.get.side_effect = get
+
+        pots = asyncio.run(fetch_pots_all(mock_async_client, ["acc_1", "acc_2"]))
+        assert [p.id for p in pots] == ["pot_1", "pot_2", "pot_3"]
@@ -1,103 +1,154 @@
 """Tests for MonzoDatabase class."""
 
-from datetime import UTC, datetime
+import shutil
+from datetime import UTC, date, datetime
 from pathlib import Path
 
+import duckdb
 import pytest
 
-from monzo_api.src.database import MonzoDatabase
+from monzo_api.src.database import MEMORY, MonzoDatabase
 from monzo_api.src.models import Account, Merchant, MonzoExport, Pot, Transaction
 
+# Tests never rely on insertion order, and two threads is plenty for tiny fixtures
+TEST_CONFIG = {"preserve_insertion_order": False, "threads": 2}
+
+# Export timestamps are not stored in the database, so any fixed value will do
+_FIXED_EXPORTED_AT = datetime(2024, 6, 1, tzinfo=UTC)
+
+
+@pytest.fixture(scope="session")
+def schema_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the schema once per session into a template database file."""
+    path = tmp_path_factory.mktemp("template") / "template.duckdb"
+    MonzoDatabase(path).setup()
+    return path
+
+
+@pytest.fixture
+def temp_db(tmp_path: Path, schema_template: Path) -> Path:
+    """Return a path to a fresh copy of the template database (schema set up)."""
+    path = tmp_path / "test.duckdb"
+    shutil.copyfile(schema_template, path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def read_only_db(schema_template: Path) -> MonzoDatabase:
+    """Return a read-only database on the shared template, safe to share between tests."""
+    return MonzoDatabase(schema_template, read_only=True)
+
+
+@pytest.fixture
+def mem_db() -> MonzoDatabase:
+    """Return an in-memory database with the schema set up."""
+    db = MonzoDatabase(MEMORY, config=TEST_CONFIG)
+    db.setup()
+    return db
+
+
+@pytest.fixture(scope="module")
+def shared_import_db() -> MonzoDatabase:
+    """Return one in-memory database without foreign keys, shared across the module."""
+    db = MonzoDatabase(MEMORY, config=TEST_CONFIG)
+    db.setup(enforce_fks=False)
+    return db
+
 
 @pytest.fixture
-def temp_db(tmp_path: Path) -> Path:
-    """Return a path for a temporary database (file doesn't exist yet)."""
-    return tmp_path / "test.duckdb"
+def import_db(shared_import_db: MonzoDatabase) -> MonzoDatabase:
+    """Return the shared import database, emptied (much cheaper than rebuilding it)."""
+    with shared_import_db as conn:
+        conn.execute(
+            "DELETE FROM transactions; DELETE FROM pots; DELETE FROM merchants; DELETE FROM accounts"
+        )
+    return shared_import_db
 
 
 class TestMonzoDatabase:
     """End-to-end tests for MonzoDatabase."""
 
-    def test_setup_creates_tables(self, temp_db: Path, capsys: pytest.CaptureFixture) -> None:
-        """Setup should create all tables and indexes."""
-        db = MonzoDatabase(temp_db)
-        db.setup()
+    def test_setup_creates_tables(self) -> None:
+        """Setup should create all tables and views, and report them."""
+        tables = MonzoDatabase(MEMORY).setup()
 
-        captured = capsys.readouterr()
-        assert "Database setup complete" in captured.out
+        assert tables == ["accounts", "daily_balances", "merchants", "pots", "transactions"]
 
-        # Verify tables exist by querying them
-        with db as conn:
-            for table in ["accounts", "merchants", "transactions", "pots"]:
-                result = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()  # noqa: S608
-                assert result is not None
-
-    def test_context_manager_returns_connection(self, temp_db: Path) -> None:
-        """Context manager should return a working DuckDB connection."""
-        db = MonzoDatabase(temp_db)
-        db.setup()
+    @pytest.mark.parametrize("enforce_fks", [True, False])
+    def test_setup_enforce_fks(self, enforce_fks: bool) -> None:
+        """Orphan rows should be rejected only when foreign keys are enforced."""
+        db = MonzoDatabase(MEMORY)
+        db.setup(enforce_fks=enforce_fks)
 
         with db as conn:
+            insert = "INSERT INTO pots (id, account_id) VALUES ('pot_1', 'missing')"
+            if enforce_fks:
+                with pytest.raises(duckdb.ConstraintException):
+                    conn.execute(insert)
+            else:
+                conn.execute(insert)
+
+    def test_context_manager_returns_connection(self, mem_db: MonzoDatabase) -> None:
+        """Context manager should return a working DuckDB connection."""
+        with mem_db as conn:
             conn.execute("INSERT INTO accounts (id, type) VALUES ('acc_123', 'uk_retail')")
             result = conn.execute("SELECT id FROM accounts").fetchone()
             assert result[0] == "acc_123"
 
-    def test_stats_returns_row_counts(self, temp_db: Path) -> None:
+    def test_stats_returns_row_counts(self, mem_db: MonzoDatabase) -> None:
         """Stats should return dict with row counts for all tables."""
-        db = MonzoDatabase(temp_db)
-        db.setup()
-
         # Insert some test data
-        with db as conn:
-            conn.execute("INSERT INTO accounts (id, type) VALUES ('acc_1', 'uk_retail')")
-            conn.execute("INSERT INTO accounts (id, type) VALUES ('acc_2', 'uk_retail')")
-            conn.execute("INSERT INTO merchants (id, name) VALUES ('merch_1', 'Test Shop')")
+        with mem_db as conn:
+            conn.execute("""
+                INSERT INTO accounts (id, type) VALUES ('acc_1', 'uk_retail'), ('acc_2', 'uk_retail');
+                INSERT INTO merchants (id, name) VALUES ('merch_1', 'Test Shop');
+            """)
 
-        stats = db.stats()
-        assert stats["accounts"] == 2
-        assert stats["merchants"] == 1
-        assert stats["transactions"] == 0
-        assert stats["pots"] == 0
+            stats = mem_db.stats(conn)
+            assert stats["accounts"] == 2
+            assert stats["merchants"] == 1
+            assert stats["transactions"] == 0
+            assert stats["pots"] == 0
 
-    def test_reset_clears_all_data(self, temp_db: Path) -> None:
-        """Reset should drop and recreate all tables."""
+    def test_stats_reuses_open_connection(self, temp_db: Path) -> None:
+        """Stats inside a with-block should use that connection, not open another."""
         db = MonzoDatabase(temp_db)
-        db.setup()
-
-        # Insert data
         with db as conn:
             conn.execute("INSERT INTO accounts (id, type) VALUES ('acc_1', 'uk_retail')")
-            conn.execute("INSERT INTO merchants (id, name) VALUES ('merch_1', 'Shop')")
+            # A second, read-only connection to an open file would be refused
+            assert db.stats()["accounts"] == 1
+
+    def test_reset_clears_all_data(self, mem_db: MonzoDatabase) -> None:
+        """Reset should drop and recreate all tables."""
+        # Insert data
+        with mem_db as conn:
+            conn.execute("""
+                INSERT INTO accounts (id, type) VALUES ('acc_1', 'uk_retail');
+                INSERT INTO merchants (id, name) VALUES ('merch_1', 'Shop');
+            """)
 
         # Reset
-        db.reset()
+        mem_db.reset()
 
         # Verify empty
-        stats = db.stats()
+        stats = mem_db.stats()
         assert all(count == 0 for count in stats.values())
 
-    def test_read_only_connection(self, temp_db: Path) -> None:
+    def test_read_only_connection(self, read_only_db: MonzoDatabase) -> None:
         """Read-only connection should prevent writes."""
-        db = MonzoDatabase(temp_db)
-        db.setup()
-
-        db_ro = MonzoDatabase(temp_db, read_only=True)
-        with db_ro as conn:
+        with read_only_db as conn:
             # Read should work
             conn.execute("SELECT * FROM accounts")
 
             # Write should fail
-            with pytest.raises(Exception):  # noqa: B017
+            with pytest.raises(duckdb.InvalidInputException, match="read-only"):
                 conn.execute("INSERT INTO accounts (id, type) VALUES ('x', 'y')")
 
-    def test_daily_balances_view(self, temp_db: Path) -> None:
+    def test_daily_balances_view(self, mem_db: MonzoDatabase) -> None:
         """Daily balances view should calculate running totals."""
-        db = MonzoDatabase(temp_db)
-        db.setup()
-
-        with db as conn:
-            conn.execute("INSERT INTO accounts (id, type) VALUES ('acc_1', 'uk_retail')")
+        with mem_db as conn:
             conn.execute("""
+                INSERT INTO accounts (id, type) VALUES ('acc_1', 'uk_retail');
                 INSERT INTO transactions (id, account_id, amount, created, currency)
                 VALUES
                     ('tx_1', 'acc_1', 10000, '2024-01-01 10:00:00', 'GBP'),
@@ -113,98 +164,70 @@ class TestMonzoDatabase:
 
             # Day 1: +10000 - 2000 = 8000 net, 8000 eod
             # Day 2: -3000 net, 5000 eod
-            assert len(result) == 2
-            assert result[0][1] == 8000  # daily_net day 1
-            assert result[0][2] == 8000  # eod_balance day 1
-            assert result[1][1] == -3000  # daily_net day 2
-            assert result[1][2] == 5000  # eod_balance day 2
-
-    def test_import_accounts(self, temp_db: Path) -> None:
-        """Should import Account models."""
-        db = MonzoDatabase(temp_db)
-        db.setup()
-
-        accounts = [
-            Account(id="acc_1", type="uk_retail", closed=False),
-            Account(id="acc_2", type="uk_retail_joint", closed=True),
-        ]
-        count = db.import_accounts(accounts)
-
-        assert count == 2
-        with db as conn:
-            rows = conn.execute("SELECT id, type, closed FROM accounts ORDER BY id").fetchall()
-            assert rows[0] == ("acc_1", "uk_retail", False)
-            assert rows[1] == ("acc_2", "uk_retail_joint", True)
-
-    def test_import_merchants(self, temp_db: Path) -> None:
-        """Should import Merchant models."""
-        db = MonzoDatabase(temp_db)
-        db.setup()
-
-        merchants = {
-            "merch_1": Merchant(
-                id="merch_1", name="Coffee Shop", category="eating_out", emoji="☕"
+            assert result == [(date(2024, 1, 1), 8000, 8000), (date(2024, 1, 2), -3000, 5000)]
+
+    @pytest.mark.parametrize(
+        ("method", "data", "query", "expected"),
+        [
+            (
+                "import_accounts",
+                [
+                    Account(id="acc_1", type="uk_retail", closed=False),
+                    Account(id="acc_2", type="uk_retail_joint", closed=True),
+                ],
+                "SELECT id, type, closed FROM accounts ORDER BY id",
+                [("acc_1", "uk_retail", False), ("acc_2", "uk_retail_joint", True)],
             ),
-            "merch_2": Merchant(id="merch_2", name="Supermarket", category="groceries"),
-        }
-        count = db.import_merchants(merchants)
-
-        assert count == 2
-        with db as conn:
-            rows = conn.execute("SELECT id, name, category FROM merchants ORDER BY id").fetchall()
-            assert rows[0] == ("merch_1", "Coffee Shop", "eating_out")
-            assert rows[1] == ("merch_2", "Supermarket", "groceries")
-
-    def test_import_transactions(self, temp_db: Path) -> None:
-        """Should import Transaction models."""
-        db = MonzoDatabase(temp_db)
-        db.setup()
-
-        # Need account first due to FK
-        with db as conn:
-            conn.execute("INSERT INTO accounts (id, type) VALUES ('acc_1', 'uk_retail')")
-
-        transactions = [
-            Transaction(
-                id="tx_1",
-                account_id="acc_1",
-                amount=-500,
-                created=datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC),
-                category="eating_out",
+            (
+                "import_merchants",
+                {
+                    "merch_1": Merchant(
+                        id="merch_1", name="Coffee Shop", category="eating_out", emoji="☕"
+                    ),
+                    "merch_2": Merchant(id="merch_2", name="Supermarket", category="groceries"),
+                },
+                "SELECT id, name, category FROM merchants ORDER BY id",
+                [("merch_1", "Coffee Shop", "eating_out"), ("merch_2", "Supermarket", "groceries")],
             ),
-        ]
-        count = db.import_transactions(transactions)
-
-        assert count == 1
-        with db as conn:
-            row = conn.execute("SELECT id, amount, category FROM transactions").fetchone()
-            assert row == ("tx_1", -500, "eating_out")
-
-    def test_import_pots(self, temp_db: Path) -> None:
-        """Should import Pot models."""
-        db = MonzoDatabase(temp_db)
-        db.setup()
-
-        # Need account first due to FK
-        with db as conn:
-            conn.execute("INSERT INTO accounts (id, type) VALUES ('acc_1', 'uk_retail')")
-
-        pots = [
-            Pot(id="pot_1", name="Savings", balance=10000, current_account_id="acc_1"),
-        ]
-        count = db.import_pots(pots)
-
-        assert count == 1
-        with db as conn:
-            row = conn.execute("SELECT id, name, balance FROM pots").fetchone()
-            assert row == ("pot_1", "Savings", 10000)
-
-    def test_import_data_full_export(self, temp_db: Path, capsys: pytest.CaptureFixture) -> None:
+            (
+                "import_transactions",
+                [
+                    Transaction(
+                        id="tx_1",
+                        account_id="acc_1",
+                        amount=-500,
+                        created=datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC),
+                        category="eating_out",
+                    ),
+                ],
+                "SELECT id, amount, category FROM transactions",
+                [("tx_1", -500, "eating_out")],
+            ),
+            (
+                "import_pots",
+                [Pot(id="pot_1", name="Savings", balance=10000, current_account_id="acc_1")],
+                "SELECT id, name, balance FROM pots",
+                [("pot_1", "Savings", 10000)],
+            ),
+        ],
+        ids=["accounts", "merchants", "transactions", "pots"],
+    )
+    def test_import_models(
+        self, import_db: MonzoDatabase, method: str, data: list | dict, query: str, expected: list
+    ) -> None:
+        """Each import method should write its models and return the count."""
+        with import_db as conn:
+            count = getattr(import_db, method)(data)
+
+            assert count == len(expected)
+            assert conn.execute(query).fetchall() == expected
+
+    def test_import_data_full_export(
+        self, mem_db: MonzoDatabase, capsys: pytest.CaptureFixture
+    ) -> None:
         """Should import a complete MonzoExport."""
-        db = MonzoDatabase(temp_db)
-
         export = MonzoExport(
-            exported_at=datetime.now(UTC),
+            exported_at=_FIXED_EXPORTED_AT,
             accounts=[Account(id="acc_1", type="uk_retail")],
             pots=[Pot(id="pot_1", name="Savings", balance=5000, current_account_id="acc_1")],
             transactions={
@@ -220,7 +243,7 @@ class TestMonzoDatabase:
             },
         )
 
-        counts = db.import_data(export)
+        counts = mem_db.import_data(export)
 
         assert counts["accounts"] == 1
         assert counts["merchants"] == 1
@@ -228,18 +251,18 @@ class TestMonzoDatabase:
         assert counts["pots"] == 1
 
         # Verify data in DB
-        stats = db.stats()
+        stats = mem_db.stats()
         assert stats["accounts"] == 1
         assert stats["merchants"] == 1
         assert stats["transactions"] == 1
         assert stats["pots"] == 1
+        with mem_db as conn:
+            assert conn.execute("SELECT merchant_id FROM transactions").fetchall() == [("merch_1",)]
 
-    def test_import_is_idempotent(self, temp_db: Path) -> None:
+    def test_import_is_idempotent(self, mem_db: MonzoDatabase) -> None:
         """Importing same data twice should not create duplicates (upsert)."""
-        db = MonzoDatabase(temp_db)
-
         export = MonzoExport(
-            exported_at=datetime.now(UTC),
+            exported_at=_FIXED_EXPORTED_AT,
             accounts=[Account(id="acc_1", type="uk_retail")],
             pots=[Pot(id="pot_1", name="Savings", balance=5000, current_account_id="acc_1")],
             transactions={
@@ -256,28 +279,63 @@ class TestMonzoDatabase:
         )
 
         # Import twice
-        db.import_data(export)
-        db.import_data(export)
+        mem_db.import_data(export)
+        mem_db.import_data(export)
 
         # Should still only have 1 of each
-        stats = db.stats()
+        stats = mem_db.stats()
         assert stats["accounts"] == 1
         assert stats["merchants"] == 1
         assert stats["transactions"] == 1
         assert stats["pots"] == 1
 
-    def test_import_updates_existing_records(self, temp_db: Path) -> None:
+    def test_import_updates_existing_records(self, mem_db: MonzoDatabase) -> None:
         """Importing with same ID should update existing record."""
-        db = MonzoDatabase(temp_db)
-        db.setup()
-
         # First import
-        db.import_accounts([Account(id="acc_1", type="uk_retail", description="Old")])
+        mem_db.import_accounts([Account(id="acc_1", type="uk_retail", description="Old")])
 
         # Second import with updated description
-        db.import_accounts([Account(id="acc_1", type="uk_retail", description="New")])
+        mem_db.import_accounts([Account(id="acc_1", type="uk_retail", description="New")])
 
         # Should have updated value
-        with db as conn:
+        with mem_db as conn:
             row = conn.execute("SELECT description FROM accounts WHERE id = 'acc_1'").fetchone()
             assert row[0] == "New"
+
+    def test_import_repeated_id_keeps_last(self, mem_db: MonzoDatabase) -> None:
+        """A primary key repeated within one import should keep its last row."""
+        mem_db.import_accounts(
+            [
+                Account(id="acc_1", type="uk_retail", description="1"),
+                Account(id="acc_1", type="uk_retail", description="2"),
+            ]
+        )
+
+        with mem_db as conn:
+            assert conn.execute("SELECT description FROM accounts").fetchall() == [("2",)]
+
+    def test_import_settled_string_among_datetimes(self, import_db: MonzoDatabase) -> None:
+        """A settled string Arrow cannot stage should still be cast by DuckDB."""
+        created = datetime(2024, 1, 1, tzinfo=UTC)
+        import_db.import_transactions(
+            [
+                Transaction(
+                    id="tx_1",
+                    account_id="acc_1",
+                    amount=-1,
+                    created=created,
+                    settled=datetime(2024, 1, 2, tzinfo=UTC),
+                ),
+                Transaction.model_construct(
+                    id="tx_2",
+                    account_id="acc_1",
+                    amount=-1,
+                    created=created,
+                    settled="2024-01-03 00:00:00",
+                ),
+            ]
+        )
+
+        with import_db as conn:
+            rows = conn.execute("SELECT settled::DATE FROM transactions ORDER BY id").fetchall()
+        assert rows == [(date(2024, 1, 2),), (date(2024, 1, 3),)]
@@ -0,0 +1,249 @@
+"""Tests for MonzoExport save/load."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from monzo_api.src.models import (
+    Account,
+    Address,
+    Counterparty,
+    Merchant,
+    MonzoExport,
+    Pot,
+    Transaction,
+)
+
+
+@pytest.fixture
+def export() -> MonzoExport:
+    """Create a small export covering nested models."""
+    return MonzoExport(
+        exported_at=datetime(2024, 6, 1, tzinfo=UTC),
+        days=30,
+        accounts=[Account(id="acc_1", type="uk_retail", created=datetime(2020, 1, 1, tzinfo=UTC))],
+        pots=[
+            Pot(
+                id="pot_1",
+                name="Savings",
+                balance=5000,
+                current_account_id="acc_1",
+                created=datetime(2021, 1, 1, tzinfo=UTC),
+            )
+        ],
+        transactions={
+            "acc_1": [
+                Transaction(
+                    id="tx_1",
+                    account_id="acc_1",
+                    amount=-100,
+                    created=datetime(2024, 1, 1, 10, 0, 0, 795000, tzinfo=UTC),
+                    settled="",
+                    merchant=Merchant(id="merch_1", name="Shop", address=Address(city="London")),
+                ),
+                Transaction(
+                    id="tx_2",
+                    account_id="acc_1",
+                    amount=51817,
+                    created=datetime(2024, 1, 2, tzinfo=UTC),
+                    settled=datetime(2024, 1, 3, tzinfo=UTC),
+                    merchant="merch_2",
+                    counterparty=Counterparty(name="Employer"),
+                    metadata={"payday": "true"},
+                ),
+            ]
+        },
+    )
+
+
+class TestSaveLoad:
+    """Round-trip tests for MonzoExport.save and MonzoExport.load."""
+
+    def test_roundtrip(self, export: MonzoExport, tmp_path: Path) -> None:
+        """Validated load should reproduce the saved export."""
+        path = tmp_path / "export.json"
+        export.save(path)
+
+        assert MonzoExport.load(path) == export
+
+    def test_save_matches_model_dump(self, export: MonzoExport, tmp_path: Path) -> None:
+        """Direct orjson serialisation should write the same document as pydantic."""
+        path = tmp_path / "export.json"
+        export.save(path)
+
+        assert orjson.loads(path.read_bytes()) == export.model_dump(mode="json")
+
+    def test_roundtrip_streaming(self, export: MonzoExport, tmp_path: Path) -> None:
+        """Streaming load should build the same models as a validated load."""
+        path = tmp_path / "export.json"
+        export.save(path)
+
+        loaded = MonzoExport.load_streaming(path)
+
+        assert loaded.model_dump() == export.model_dump()
+        tx = loaded.transactions["acc_1"][0]
+        assert isinstance(tx.merchant, Merchant)
+        assert isinstance(tx.merchant.address, Address)
+        assert tx.created == datetime(2024, 1, 1, 10, 0, 0, 795000, tzinfo=UTC)
+
+    def test_streaming_field_order(self, export: MonzoExport, tmp_path: Path) -> None:
+        """Transactions should be saved last; older files with fields after them still load."""
+        path = tmp_path / "export.json"
+        export.save(path)
+        assert list(orjson.loads(path.read_bytes()))[-1] == "transactions"
+
+        raw = export.model_dump(mode="json")
+        raw["merchants_index"] = raw.pop("merchants_index") | {"merch_9": {"id": "merch_9"}}
+        path.write_bytes(orjson.dumps(raw))
+
+        loaded = MonzoExport.load_streaming(path)
+
+        assert loaded.transactions == export.transactions
+        assert loaded.all_merchants.keys() == {"merch_1"}
+
+
+class TestCachedProperties:
+    """Tests for MonzoExport derived collections."""
+
+    def test_all_transactions_is_cached(self, export: MonzoExport) -> None:
+        """Flattened transactions should be built once and reused."""
+        assert export.all_transactions is export.all_transactions
+        assert [tx.id for tx in export.all_transactions] == ["tx_1", "tx_2"]
+
+    def test_all_merchants_only_expanded(self, export: MonzoExport) -> None:
+        """Only expanded merchants should be collected, keyed by ID."""
+        assert export.all_merchants.keys() == {"merch_1"}
+
+    def test_all_merchants_uses_index(self, export: MonzoExport, tmp_path: Path) -> None:
+        """A fetch-time merchant index should be returned as-is and survive a roundtrip."""
+        indexed = export.model_copy(update={"merchants_index": export.all_merchants})
+        assert indexed.all_merchants is indexed.merchants_index
+
+        path = tmp_path / "export.json"
+        indexed.save(path)
+        for loaded in (MonzoExport.load(path), MonzoExport.load_streaming(path)):
+            assert isinstance(loaded.merchants_index["merch_1"].address, Address)
+            assert loaded.all_merchants == indexed.merchants_index
+
+    def test_transactions_table(self, export: MonzoExport) -> None:
+        """Arrow view should have one row per transaction with integer amounts."""
+        table = export.transactions_table
+
+        assert table is export.transactions_table
+        assert table.column("id").to_pylist() == ["tx_1", "tx_2"]
+        assert table.column("merchant_id").to_pylist() == ["merch_1", "merch_2"]
+        assert table.column("amount").to_pylist() == [-100, 51817]
+
+    def test_copy_with_update_rebuilds_cache(self, export: MonzoExport) -> None:
+        """Cached views should follow transactions replaced through model_copy."""
+        _ = export.all_transactions, export.all_merchants, export.transactions_table
+
+        emptied = export.model_copy(update={"transactions": {}})
+
+        assert emptied.all_transactions == []
+        assert emptied.all_merchants == {}
+        assert emptied.transactions_table.num_rows == 0
+        assert export.transactions_table.num_rows == 2
+
+    def test_export_is_frozen(self, export: MonzoExport) -> None:
+        """Fields cannot be reassigned underneath the cached views."""
+        with pytest.raises(ValidationError):
+            export.transactions = {}
+
+    def test_cache_not_serialized(self, export: MonzoExport) -> None:
+        """Cached values should not leak into the dumped model."""
+        _ = export.all_merchants
+        assert "all_merchants" not in export.model_dump()
+
+
+class TestMerchantId:
+    """Tests for splitting the API's merchant field into merchant_id + merchant."""
+
+    @pytest.mark.parametrize(
+        ("merchant", "merchant_id", "expanded"),
+        [
+            ("merch_1", "merch_1", False),
+            ({"id": "merch_1", "name": "Shop"}, "merch_1", True),
+            ("", None, False),
+            (None, None, False),
+        ],
+    )
+    def test_split(self, merchant: object, merchant_id: str | None, expanded: bool) -> None:
+        """merchant_id should be derived from a bare ID or an expanded merchant."""
+        raw = {"id": "tx_1", "account_id": "acc_1", "amount": 1, "created": "2024-01-01T00:00:00Z"}
+        for tx in (
+            Transaction.model_validate(raw | {"merchant": merchant}),
+            Transaction.model_validate_json(orjson.dumps(raw | {"merchant": merchant})),
+        ):
+            assert tx.merchant_id == merchant_id
+            assert isinstance(tx.merchant, Merchant) is expanded
+
+    def test_construct_with_merchant_only(self) -> None:
+        """Building a transaction from an expanded merchant alone should set merchant_id."""
+        tx = Transaction(
+            id="tx_1",
+            account_id="acc_1",
+            amount=1,
+            created=datetime(2024, 1, 1, tzinfo=UTC),
+            merchant=Merchant(id="merch_1"),
+        )
+        assert tx.merchant_id == "merch_1"
+
+    def test_merchant_id_is_interned(self) -> None:
+        """Repeated merchant IDs should share one string object once split."""
+        raw = {"id": "tx_1", "account_id": "acc_1", "amount": 1, "created": "2024-01-01T00:00:00Z"}
+        first, second = (
+            Transaction.model_validate(raw | {"merchant": "".join(["merch_", "9"])})
+            for _ in range(2)
+        )
+        assert first.merchant_id is second.merchant_id
+
+    def test_load_legacy_merchant(self, export: MonzoExport, tmp_path: Path) -> None:
+        """Files saved before merchant_id existed should still load, with the ID split out."""
+        raw = export.model_dump(mode="json")
+        expanded, bare = raw["transactions"]["acc_1"]
+        del expanded["merchant_id"], bare["merchant_id"]
+        # A raw dict elsewhere in the file may carry the key without marking the format
+        expanded["metadata"] = {"merchant_id": "merch_1"}
+        path = tmp_path / "export.json"
+        path.write_bytes(orjson.dumps(raw))
+        expected = [tx.merchant for tx in export.transactions["acc_1"]]
+
+        for loaded in (MonzoExport.load(path), MonzoExport.load_streaming(path)):
+            txs = loaded.transactions["acc_1"]
+            assert [tx.merchant_id for tx in txs] == ["merch_1", "merch_2"]
+            assert [tx.merchant for tx in txs] == expected
+
+
+class TestTransactionAmounts:
+    """Tests for Transaction amount accessors."""
+
+    @pytest.mark.parametrize(
+        ("amount", "expected"),
+        [(-503, "-5.03"), (-5, "-0.05"), (0, "0.00"), (51817, "518.17")],
+    )
+    def test_formatted_amount(self, amount: int, expected: str) -> None:
+        """Amounts in pence should format exactly as pounds."""
+        tx = Transaction(
+            id="tx_1", account_id="acc_1", amount=amount, created=datetime(2024, 1, 1, tzinfo=UTC)
+        )
+        assert tx.formatted_amount == expected
+
+    def test_amount_pounds_deprecated(self) -> None:
+        """amount_pounds should still work but warn."""
+        tx = Transaction(
+            id="tx_1", account_id="acc_1", amount=-503, created=datetime(2024, 1, 1, tzinfo=UTC)
+        )
+        with pytest.deprecated_call():
+            assert tx.amount_pounds == -5.03
+
+    def test_transaction_is_frozen(self) -> None:
+        """Transactions should be immutable once built."""
+        tx = Transaction(
+            id="tx_1", account_id="acc_1", amount=-503, created=datetime(2024, 1, 1, tzinfo=UTC)
+        )
+        with pytest.raises(ValidationError):
+            tx.amount = 0